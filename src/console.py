@@ -0,0 +1,88 @@
+# =============================================================================
+# DistriPartner Platform - Console Helpers
+# =============================================================================
+# Interactive input shared by the agent and workflow runners.
+# =============================================================================
+
+import asyncio
+import os
+import sys
+import threading
+
+
+# Exceptions that mean the user interrupted an interactive session. Under
+# asyncio.run(), Ctrl-C arrives as a cancellation of the main task.
+INTERRUPTED = (KeyboardInterrupt, asyncio.CancelledError)
+
+# Bytes read from stdin that follow the last line returned
+_stdin_buffer = bytearray()
+
+
+async def async_input(prompt: str = "") -> str:
+    """Read a line from stdin without blocking the event loop.
+
+    Stdin is read in raw chunks, so nothing holds the lock on sys.stdin's
+    buffer while a prompt waits. An interrupted prompt therefore leaves no
+    blocked reader behind at interpreter shutdown.
+
+    Raises:
+        EOFError: If stdin is closed before a line is entered
+    """
+    if prompt:
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+
+    fd = sys.stdin.fileno()
+    while (end := _stdin_buffer.find(b"\n")) < 0:
+        chunk = await read_chunk(fd)
+        if not chunk:
+            if not _stdin_buffer:
+                raise EOFError
+            # Final line without a trailing newline
+            end = len(_stdin_buffer)
+            break
+        _stdin_buffer.extend(chunk)
+
+    line = bytes(_stdin_buffer[:end])
+    del _stdin_buffer[:end + 1]
+    return line.decode(sys.stdin.encoding or "utf-8", sys.stdin.errors or "strict")
+
+
+async def read_chunk(fd: int) -> bytes:
+    """Wait until fd is readable and return the next chunk (b"" at EOF).
+
+    Uses the event loop's reader callbacks where they are supported (POSIX
+    pipes and terminals). Otherwise, for example on Windows or with a
+    regular file redirected to stdin, the read runs on a daemon thread.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def resolve(chunk, error):
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(chunk)
+
+    def read():
+        try:
+            chunk, error = os.read(fd, 4096), None
+        except OSError as e:
+            chunk, error = None, e
+        return chunk, error
+
+    try:
+        loop.add_reader(fd, lambda: resolve(*read()))
+    except (NotImplementedError, OSError):
+        def read_in_thread():
+            loop.call_soon_threadsafe(resolve, *read())
+
+        threading.Thread(target=read_in_thread, daemon=True).start()
+        return await future
+
+    try:
+        return await future
+    finally:
+        loop.remove_reader(fd)
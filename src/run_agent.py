@@ -18,14 +18,14 @@
 import asyncio
 import argparse
 import os
+import sys
 from pathlib import Path
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
-from agent_framework_declarative import AgentFactory
-from azure.identity.aio import DefaultAzureCredential
+from console import INTERRUPTED, async_input
 
 
 # Available agents and their YAML files
@@ -41,18 +41,21 @@ AVAILABLE_AGENTS = {
     "communication": "communication.yaml",
 }
 
+# Resolved paths, computed once at import time
+AGENT_PATHS = {name: AGENTS_DIR / filename for name, filename in AVAILABLE_AGENTS.items()}
+ENV_FILE_PATH = str(Path(__file__).parent.parent / ".env")
+
 
 def list_agents():
     """List all available agents."""
-    print("\n📋 Available Agents:")
-    print("-" * 50)
-    for name, filename in AVAILABLE_AGENTS.items():
-        yaml_path = AGENTS_DIR / filename
+    lines = ["\n📋 Available Agents:", "-" * 50]
+    for name, yaml_path in AGENT_PATHS.items():
         status = "✅" if yaml_path.exists() else "❌"
-        print(f"  {status} {name:<20} ({filename})")
-    print("-" * 50)
-    print("\nUsage: python run_agent.py --agent <agent_name>")
-    print("       python run_agent.py  (defaults to orchestrator)\n")
+        lines.append(f"  {status} {name:<20} ({yaml_path.name})")
+    lines.append("-" * 50)
+    lines.append("\nUsage: python run_agent.py --agent <agent_name>")
+    lines.append("       python run_agent.py  (defaults to orchestrator)\n")
+    print("\n".join(lines))
 
 
 async def run_agent(agent_name: str):
@@ -63,28 +66,27 @@ async def run_agent(agent_name: str):
         list_agents()
         return
     
-    yaml_file = AVAILABLE_AGENTS[agent_name]
-    yaml_path = AGENTS_DIR / yaml_file
+    yaml_path = AGENT_PATHS[agent_name]
     
     if not yaml_path.exists():
         print(f"❌ Agent file not found: {yaml_path}")
         return
     
-    print(f"\n🤖 Loading agent: {agent_name}")
-    print(f"   File: {yaml_path}")
-    print("-" * 50)
+    print(f"\n🤖 Loading agent: {agent_name}\n   File: {yaml_path}\n" + "-" * 50)
     
     # Check required environment variables
-    required_vars = ["AZURE_AI_PROJECT_ENDPOINT"]
-    missing_vars = [var for var in required_vars if not os.getenv(var)]
+    project_endpoint = os.getenv("AZURE_AI_PROJECT_ENDPOINT")
     
-    if missing_vars:
+    if not project_endpoint:
         print(f"\n❌ Missing required environment variables:")
-        for var in missing_vars:
-            print(f"   - {var}")
+        print("   - AZURE_AI_PROJECT_ENDPOINT")
         print("\n💡 Copy .env.fake to .env and fill in your values.")
         return
     
+    # Deferred so --list and the early exits above skip the Azure SDK import cost
+    from agent_framework_declarative import AgentFactory
+    from azure.identity.aio import DefaultAzureCredential
+    
     # Create credential for Azure authentication
     credential = DefaultAzureCredential()
     
@@ -94,26 +96,28 @@ async def run_agent(agent_name: str):
         factory = AgentFactory(
             client_kwargs={
                 "credential": credential,
-                "project_endpoint": os.getenv("AZURE_AI_PROJECT_ENDPOINT"),
+                "project_endpoint": project_endpoint,
             },
-            env_file_path=str(Path(__file__).parent.parent / ".env"),
+            env_file_path=ENV_FILE_PATH,
             safe_mode=False
         )
         
         # Load agent from YAML
         agent = factory.create_agent_from_yaml_path(yaml_path)
         
-        print(f"✅ Agent '{agent_name}' loaded successfully!")
-        print("\n💬 Interactive Chat Mode")
-        print("   Type your message and press Enter.")
-        print("   Type 'quit' or 'exit' to stop.\n")
-        print("=" * 50)
+        print(
+            f"✅ Agent '{agent_name}' loaded successfully!\n"
+            "\n💬 Interactive Chat Mode\n"
+            "   Type your message and press Enter.\n"
+            "   Type 'quit' or 'exit' to stop.\n\n"
+            + "=" * 50
+        )
         
         # Interactive chat loop
         async with agent:
             while True:
                 try:
-                    user_input = input("\n👤 You: ").strip()
+                    user_input = (await async_input("\n👤 You: ")).strip()
                     
                     if not user_input:
                         continue
@@ -122,11 +126,15 @@ async def run_agent(agent_name: str):
                         print("\n👋 Goodbye!")
                         break
                     
+                    # Stream the reply so text appears as soon as it is generated
                     print("\n🤖 Agent: ", end="", flush=True)
-                    response = await agent.run(user_input)
-                    print(response)
+                    async for update in agent.run_stream(user_input):
+                        if update.text:
+                            sys.stdout.write(update.text)
+                            sys.stdout.flush()
+                    print(flush=True)
                     
-                except KeyboardInterrupt:
+                except INTERRUPTED:
                     print("\n\n👋 Interrupted. Goodbye!")
                     break
                     
@@ -170,11 +178,15 @@ Examples:
         list_agents()
         return
     
-    print("\n" + "=" * 50)
-    print("  DistriPartner Platform - Agent Runner")
-    print("=" * 50)
+    print("\n" + "=" * 50 + "\n  DistriPartner Platform - Agent Runner\n" + "=" * 50)
+    
+    # Use uvloop's faster event loop when it is installed (not available on Windows)
+    try:
+        from uvloop import run as run_loop
+    except ImportError:
+        run_loop = asyncio.run
     
-    asyncio.run(run_agent(args.agent))
+    run_loop(run_agent(args.agent))
 
 
 if __name__ == "__main__":
@@ -20,10 +20,13 @@
 
 import asyncio
 import argparse
+import functools
 import os
+import re
+import sys
 from pathlib import Path
 from collections.abc import AsyncIterable
-from typing import cast
+from typing import TYPE_CHECKING, cast
 
 from dotenv import load_dotenv
 
@@ -41,8 +44,11 @@ from agent_framework import (
     WorkflowStatusEvent,
     Role,
 )
-from agent_framework_declarative import AgentFactory
-from azure.identity.aio import DefaultAzureCredential
+
+from console import INTERRUPTED, async_input
+
+if TYPE_CHECKING:
+    from agent_framework_declarative import AgentFactory
 
 
 # Agent definitions directory
@@ -60,58 +66,107 @@ AGENT_FILES = {
     "communication": "communication.yaml",
 }
 
-# Debug mode flag
-DEBUG_MODE = False
+# Resolved paths, computed once at import time
+AGENT_PATHS = {name: AGENTS_DIR / filename for name, filename in AGENT_FILES.items()}
+ENV_FILE_PATH = str(Path(__file__).parent.parent / ".env")
+
+# Hand-off routes as (source, targets); a route is added when its source
+# and at least one of its targets are loaded
+HANDOFF_ROUTES = (
+    # Orchestrator can route to main agents
+    ("orchestrator", ("support",)),
+    ("orchestrator", ("campaignManager",)),
+    # Support can escalate to ticketing
+    ("support", ("ticketing",)),
+    # Ticketing can get data from profiler and dataCollector
+    ("ticketing", ("profiler", "dataCollector")),
+    # CampaignManager can use data agents and communication
+    ("campaignManager", ("profiler", "dataCollector", "communication", "campaignSuggestor")),
+)
+
+# User messages containing any of these words end the conversation
+TERMINATION_PATTERN = re.compile(r"adios|adiós|bye|exit|salir|gracias|thanks", re.IGNORECASE)
 
 
-def debug_print(*args, **kwargs):
-    """Print only if debug mode is enabled."""
-    if DEBUG_MODE:
-        print("[DEBUG]", *args, **kwargs)
+def print_debug(*args, **kwargs):
+    """Print a message with the debug prefix."""
+    print("[DEBUG]", *args, **kwargs)
 
 
-async def drain_stream(stream: AsyncIterable[WorkflowEvent]) -> list[WorkflowEvent]:
-    """Collect all events from an async stream into a list."""
-    return [event async for event in stream]
+def discard_debug(*args, **kwargs):
+    """Ignore a debug message."""
 
 
-def handle_events(events: list[WorkflowEvent]) -> list[RequestInfoEvent]:
-    """Process workflow events and extract pending user input requests.
+# Print only if debug mode is enabled; rebound by run_workflow() so the
+# disabled case costs a single no-op call
+debug_print = discard_debug
+
+
+def handle_status_event(event: WorkflowStatusEvent, requests: list[RequestInfoEvent]) -> None:
+    """Report workflow status changes."""
+    if event.state == WorkflowRunState.IDLE:
+        debug_print(f"[Status] Workflow IDLE")
+    elif event.state == WorkflowRunState.IDLE_WITH_PENDING_REQUESTS:
+        debug_print(f"[Status] Waiting for user input...")
+
+
+def handle_output_event(event: WorkflowOutputEvent, requests: list[RequestInfoEvent]) -> None:
+    """Print the final conversation history."""
+    conversation = cast(list[ChatMessage], event.data)
+    if isinstance(conversation, list):
+        # Build the whole history and write it in one call
+        separator = "=" * 60
+        parts = [f"\n{separator}\n📜 CONVERSATION HISTORY\n{separator}\n"]
+        for message in conversation:
+            text = message.text
+            if not text or not text.strip():
+                continue
+            speaker = message.author_name or message.role.value
+            icon = "👤" if message.role == Role.USER else "🤖"
+            body = text if len(text) <= 500 else text[:500] + "..."
+            parts.append(f"\n{icon} {speaker}:\n   {body}\n")
+        parts.append(f"\n{separator}\n")
+        sys.stdout.write("".join(parts))
+        sys.stdout.flush()
+
+
+def handle_request_event(event: RequestInfoEvent, requests: list[RequestInfoEvent]) -> None:
+    """Show agent responses and record the pending user input request."""
+    if isinstance(event.data, HandoffUserInputRequest):
+        print_agent_responses(event.data)
+    requests.append(event)
+
+
+# Event handlers keyed by event type
+EVENT_HANDLERS = {
+    WorkflowStatusEvent: handle_status_event,
+    WorkflowOutputEvent: handle_output_event,
+    RequestInfoEvent: handle_request_event,
+}
+
+
+@functools.cache
+def find_event_handler(event_type: type):
+    """Resolve the handler for an event type, falling back to its base classes."""
+    for base in event_type.__mro__:
+        handler = EVENT_HANDLERS.get(base)
+        if handler is not None:
+            return handler
+    return None
+
+
+async def consume_events(stream: AsyncIterable[WorkflowEvent]) -> list[RequestInfoEvent]:
+    """Process workflow events as they arrive and extract pending user input requests.
     
     Returns:
         List of RequestInfoEvent for pending user input requests
     """
     requests: list[RequestInfoEvent] = []
 
-    for event in events:
-        # Status changes
-        if isinstance(event, WorkflowStatusEvent):
-            if event.state == WorkflowRunState.IDLE:
-                debug_print(f"[Status] Workflow IDLE")
-            elif event.state == WorkflowRunState.IDLE_WITH_PENDING_REQUESTS:
-                debug_print(f"[Status] Waiting for user input...")
-
-        # Final conversation output
-        elif isinstance(event, WorkflowOutputEvent):
-            conversation = cast(list[ChatMessage], event.data)
-            if isinstance(conversation, list):
-                print("\n" + "=" * 60)
-                print("📜 CONVERSATION HISTORY")
-                print("=" * 60)
-                for message in conversation:
-                    if not message.text or not message.text.strip():
-                        continue
-                    speaker = message.author_name or message.role.value
-                    icon = "👤" if message.role == Role.USER else "🤖"
-                    print(f"\n{icon} {speaker}:")
-                    print(f"   {message.text[:500]}{'...' if len(message.text) > 500 else ''}")
-                print("\n" + "=" * 60)
-
-        # User input request
-        elif isinstance(event, RequestInfoEvent):
-            if isinstance(event.data, HandoffUserInputRequest):
-                print_agent_responses(event.data)
-            requests.append(event)
+    async for event in stream:
+        handler = find_event_handler(type(event))
+        if handler is not None:
+            handler(event, requests)
 
     return requests
 
@@ -121,23 +176,22 @@ def print_agent_responses(request: HandoffUserInputRequest) -> None:
     if not request.conversation:
         return
 
-    # Find responses since last user message
-    agent_responses: list[ChatMessage] = []
-    for message in request.conversation[::-1]:
-        if message.role == Role.USER:
-            break
-        if message.text and message.text.strip():
-            agent_responses.append(message)
+    # Find where the responses since the last user message start
+    conversation = request.conversation
+    start = len(conversation)
+    while start > 0 and conversation[start - 1].role != Role.USER:
+        start -= 1
 
     # Print in original order
-    agent_responses.reverse()
-    for message in agent_responses:
+    for message in conversation[start:]:
+        if not message.text or not message.text.strip():
+            continue
         speaker = message.author_name or message.role.value
         print(f"\n🤖 {speaker}:")
         print(f"   {message.text}")
 
 
-async def load_agents(factory: AgentFactory) -> dict:
+async def load_agents(factory: "AgentFactory") -> dict:
     """Load all agents from YAML definitions.
     
     Returns:
@@ -148,8 +202,7 @@ async def load_agents(factory: AgentFactory) -> dict:
     print("\n📦 Loading agents...")
     print("-" * 50)
     
-    for name, filename in AGENT_FILES.items():
-        yaml_path = AGENTS_DIR / filename
+    for name, yaml_path in AGENT_PATHS.items():
         if yaml_path.exists():
             try:
                 agent = factory.create_agent_from_yaml_path(yaml_path)
@@ -166,6 +219,16 @@ async def load_agents(factory: AgentFactory) -> dict:
     return agents
 
 
+def plan_handoffs(loaded: frozenset[str]) -> tuple[tuple[str, tuple[str, ...]], ...]:
+    """Resolve the hand-off routes available for a set of loaded agent names."""
+    routes = []
+    for source, targets in HANDOFF_ROUTES:
+        available = tuple(target for target in targets if target in loaded)
+        if source in loaded and available:
+            routes.append((source, available))
+    return tuple(routes)
+
+
 def build_workflow(agents: dict):
     """Build the hand-off workflow with all agents.
     
@@ -177,24 +240,12 @@ def build_workflow(agents: dict):
     - CampaignManager can hand off to: Profiler, DataCollector, Communication, CampaignSuggestor
     """
     
-    # Get agent instances
     orchestrator = agents.get("orchestrator")
-    support = agents.get("support")
-    ticketing = agents.get("ticketing")
-    profiler = agents.get("profiler")
-    data_collector = agents.get("dataCollector")
-    campaign_manager = agents.get("campaignManager")
-    campaign_suggestor = agents.get("campaignSuggestor")
-    communication = agents.get("communication")
-    
     if not orchestrator:
         raise ValueError("Orchestrator agent is required but not loaded")
     
-    # Get all available participants (exclude None values)
-    participants = [a for a in [
-        orchestrator, support, ticketing, profiler, 
-        data_collector, campaign_manager, campaign_suggestor, communication
-    ] if a is not None]
+    # All loaded participants, in definition order
+    participants = [agents[name] for name in AGENT_FILES if name in agents]
     
     print(f"🔧 Building workflow with {len(participants)} participants...")
     
@@ -205,39 +256,16 @@ def build_workflow(agents: dict):
     ).set_coordinator(orchestrator)
     
     # Configure hand-off routes
-    # Orchestrator can route to main agents
-    if support:
-        builder.add_handoff(orchestrator, [support])
-        debug_print("   Route: orchestrator → support")
-    if campaign_manager:
-        builder.add_handoff(orchestrator, [campaign_manager])
-        debug_print("   Route: orchestrator → campaignManager")
-    
-    # Support can escalate to ticketing
-    if support and ticketing:
-        builder.add_handoff(support, [ticketing])
-        debug_print("   Route: support → ticketing")
-    
-    # Ticketing can get data from profiler and dataCollector
-    if ticketing:
-        data_agents = [a for a in [profiler, data_collector] if a]
-        if data_agents:
-            builder.add_handoff(ticketing, data_agents)
-            debug_print(f"   Route: ticketing → {[type(a).__name__ for a in data_agents]}")
-    
-    # CampaignManager can use data agents and communication
-    if campaign_manager:
-        campaign_targets = [a for a in [profiler, data_collector, communication, campaign_suggestor] if a]
-        if campaign_targets:
-            builder.add_handoff(campaign_manager, campaign_targets)
-            debug_print(f"   Route: campaignManager → {len(campaign_targets)} agents")
+    for source, targets in plan_handoffs(frozenset(agents)):
+        builder.add_handoff(agents[source], [agents[target] for target in targets])
+        debug_print(f"   Route: {source} → {', '.join(targets)}")
     
     # Add termination condition: stop when user says goodbye/thanks/exit
     workflow = builder.with_termination_condition(
         lambda conv: (
             len(conv) > 0 and 
             conv[-1].role == Role.USER and 
-            any(word in conv[-1].text.lower() for word in ["adios", "adiós", "bye", "exit", "salir", "gracias", "thanks"])
+            TERMINATION_PATTERN.search(conv[-1].text) is not None
         )
     ).build()
     
@@ -247,20 +275,22 @@ def build_workflow(agents: dict):
 
 async def run_workflow(debug: bool = False):
     """Run the complete hand-off workflow interactively."""
-    global DEBUG_MODE
-    DEBUG_MODE = debug
+    global debug_print
+    debug_print = print_debug if debug else discard_debug
     
     # Check required environment variables
-    required_vars = ["AZURE_AI_PROJECT_ENDPOINT"]
-    missing_vars = [var for var in required_vars if not os.getenv(var)]
+    project_endpoint = os.getenv("AZURE_AI_PROJECT_ENDPOINT")
     
-    if missing_vars:
+    if not project_endpoint:
         print(f"\n❌ Missing required environment variables:")
-        for var in missing_vars:
-            print(f"   - {var}")
+        print("   - AZURE_AI_PROJECT_ENDPOINT")
         print("\n💡 Copy .env.fake to .env and fill in your values.")
         return
     
+    # Deferred so --help and the early exit above skip the Azure SDK import cost
+    from agent_framework_declarative import AgentFactory
+    from azure.identity.aio import DefaultAzureCredential
+    
     # Create credential for Azure authentication
     credential = DefaultAzureCredential()
     
@@ -269,9 +299,9 @@ async def run_workflow(debug: bool = False):
         factory = AgentFactory(
             client_kwargs={
                 "credential": credential,
-                "project_endpoint": os.getenv("AZURE_AI_PROJECT_ENDPOINT"),
+                "project_endpoint": project_endpoint,
             },
-            env_file_path=str(Path(__file__).parent.parent / ".env"),
+            env_file_path=ENV_FILE_PATH,
             safe_mode=False
         )
         
@@ -296,21 +326,20 @@ async def run_workflow(debug: bool = False):
         
         # Get initial message
         print("\n👤 You: ", end="", flush=True)
-        initial_message = input().strip()
+        initial_message = (await async_input()).strip()
         
         if not initial_message:
             initial_message = "Hola, necesito ayuda"
         
         # Start the workflow
         print("\n⏳ Processing...")
-        events = await drain_stream(workflow.run_stream(initial_message))
-        pending_requests = handle_events(events)
+        pending_requests = await consume_events(workflow.run_stream(initial_message))
         
         # Interactive loop
         while pending_requests:
             try:
                 print("\n👤 You: ", end="", flush=True)
-                user_input = input().strip()
+                user_input = (await async_input()).strip()
                 
                 if not user_input:
                     continue
@@ -321,13 +350,12 @@ async def run_workflow(debug: bool = False):
                     break
                 
                 # Send response to all pending requests
-                responses = {req.request_id: user_input for req in pending_requests}
+                responses = dict.fromkeys((req.request_id for req in pending_requests), user_input)
                 
                 print("\n⏳ Processing...")
-                events = await drain_stream(workflow.send_responses_streaming(responses))
-                pending_requests = handle_events(events)
+                pending_requests = await consume_events(workflow.send_responses_streaming(responses))
                 
-            except KeyboardInterrupt:
+            except INTERRUPTED:
                 print("\n\n👋 Interrupted. Goodbye!")
                 break
         
@@ -374,7 +402,13 @@ The workflow routes requests through multiple agents:
     print("  🚀 DistriPartner Platform - Workflow Runner")
     print("=" * 60)
     
-    asyncio.run(run_workflow(debug=args.debug))
+    # Use uvloop's faster event loop when it is installed (not available on Windows)
+    try:
+        from uvloop import run as run_loop
+    except ImportError:
+        run_loop = asyncio.run
+    
+    run_loop(run_workflow(debug=args.debug))
 
 
 if __name__ == "__main__":